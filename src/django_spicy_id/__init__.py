@@ -8,6 +8,8 @@ from .fields import (
     SpicyBigAutoField,
     SpicySmallAutoField,
 )
+from .forms import SpicyIdMultipleField
+from .routers import SpicyShardRouter
 from .utils import get_url_converter
 
 __all__ = [
@@ -21,4 +23,6 @@ __all__ = [
     MalformedSpicyIdError,
     get_url_converter,
     monkey_patch_drf,
+    SpicyShardRouter,
+    SpicyIdMultipleField,
 ]
@@ -0,0 +1,27 @@
+from . import fields
+from .forms import split_ids
+
+
+class SpicyIdSearchMixin:
+    """A `ModelAdmin` mixin which turns searches for spicy ids into exact lookups.
+
+    When every term of the search query has the form of an id for the model's
+    spicy primary key, the changelist is filtered with a single indexed `pk__in`
+    lookup, and `search_fields` are not consulted. Terms which have the right
+    form but cannot be decoded (e.g. out of range for an obfuscated field) can
+    not match any row, and are dropped. Any other search falls through to the
+    default behavior.
+
+    Note that the Django admin only shows the search box when `search_fields`
+    is not empty.
+    """
+
+    def get_search_results(self, request, queryset, search_term):
+        field = self.model._meta.pk
+        if isinstance(field, fields.BaseSpicyAutoField):
+            terms = split_ids(search_term)
+            if terms:
+                values, invalid = field._decode_strings_internal(terms)
+                if all(field.re.match(s) for s in invalid):
+                    return queryset.filter(pk__in=values), False
+        return super().get_search_results(request, queryset, search_term)
@@ -19,6 +19,9 @@ Adapted from `django.utils.baseconv` which bears the following license:
     All trademarks referenced herein are property of their respective holders.
 """
 
+import functools
+import sys
+
 BASE16_ALPHABET = "0123456789abcdef"
 BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
 BASE62_ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
@@ -79,3 +82,90 @@ class BaseConverter:
 base16 = BaseConverter(BASE16_ALPHABET)
 base58 = BaseConverter(BASE58_ALPHABET)
 base62 = BaseConverter(BASE62_ALPHABET)
+
+
+# Upper bound on the number of entries in any table built by `TableEncoder`.
+MAX_TABLE_ENTRIES = 2**16
+
+
+class TableEncoder:
+    """Encodes integers on the range [0, max_value] using precomputed tables.
+
+    When `max_value` is small enough, every encoded value is precomputed. Otherwise,
+    values are split into chunks of as many digits as fit in a table of
+    `MAX_TABLE_ENTRIES` entries (for example, 16-bit chunks in hex), and each chunk
+    is looked up in a table of fixed-width digit strings.
+
+    Output is identical to `converter.encode()`, left-padded with the first digit
+    to `pad_to` characters if given. Tables are built lazily, on first use.
+    """
+
+    def __init__(self, converter, max_value, pad_to=None):
+        self.converter = converter
+        self.max_value = max_value
+        self.pad_to = pad_to
+        self.pad_char = converter.digits[0]
+        self.is_full_table = max_value < MAX_TABLE_ENTRIES
+
+        base = len(converter.digits)
+        self.chunk_digits = 1
+        while base ** (self.chunk_digits + 1) <= MAX_TABLE_ENTRIES:
+            self.chunk_digits += 1
+        self.chunk_base = base**self.chunk_digits
+        self._table = None
+
+    def __repr__(self):
+        return "<%s: base%s, max_value=%s, pad_to=%s>" % (
+            self.__class__.__name__,
+            len(self.converter.digits),
+            self.max_value,
+            self.pad_to,
+        )
+
+    def _pad(self, encoded):
+        if self.pad_to and len(encoded) < self.pad_to:
+            return self.pad_char * (self.pad_to - len(encoded)) + encoded
+        return encoded
+
+    def _build_table(self):
+        encode = self.converter.encode
+        if self.is_full_table:
+            return [self._pad(encode(i)) for i in range(self.max_value + 1)]
+        width = self.chunk_digits
+        return [encode(i).rjust(width, self.pad_char) for i in range(self.chunk_base)]
+
+    @property
+    def table(self):
+        if self._table is None:
+            self._table = self._build_table()
+        return self._table
+
+    def memory_usage(self):
+        """Returns the approximate size of the tables built so far, in bytes."""
+        if self._table is None:
+            return 0
+        return sys.getsizeof(self._table) + sum(sys.getsizeof(s) for s in self._table)
+
+    def encode(self, i):
+        table = self.table
+        if self.is_full_table:
+            return table[i]
+
+        chunk_base = self.chunk_base
+        chunks = []
+        while i >= chunk_base:
+            i, rem = divmod(i, chunk_base)
+            chunks.append(table[rem])
+        chunks.append(table[i])
+        chunks.reverse()
+        encoded = "".join(chunks)
+
+        if self.pad_to:
+            return encoded.rjust(self.pad_to, self.pad_char)[-self.pad_to :]
+        return encoded.lstrip(self.pad_char) or self.pad_char
+
+
+@functools.lru_cache
+def get_table_encoder(converter, max_value, pad_to=None):
+    """Returns a `TableEncoder`, shared between all callers with the same arguments."""
+    return TableEncoder(converter, max_value, pad_to)
@@ -1,16 +1,19 @@
+import functools
 import math
 import re
 import secrets
+from collections.abc import Sequence
 
 import django
+from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 from django.db import models
 from django.db.models.signals import post_save
 from django.db.utils import ProgrammingError
 
-from django_spicy_id.errors import MalformedSpicyIdError
+from django_spicy_id.errors import MalformedSpicyIdError, SpicyIdError
 
-from . import baseconv
+from . import baseconv, feistel
 
 # Encoding strategies which may be selected with the `encoding=` field parameter.
 ENCODING_HEX = "hex"
@@ -46,11 +49,33 @@ def get_regex(preamble, codec, pad, char_len):
         return re.compile(f"^({escaped_preamble})([{digits}]{{{char_len}}})$")
 
 
+def get_obfuscation_key():
+    """Returns the `SPICY_ID_OBFUSCATION_KEY` setting, required by `obfuscate`."""
+    key = getattr(settings, "SPICY_ID_OBFUSCATION_KEY", None)
+    if not key:
+        raise ImproperlyConfigured("`obfuscate` requires the SPICY_ID_OBFUSCATION_KEY setting")
+    return key
+
+
 class BaseSpicyAutoField(models.Field):
     """An AutoField that is rendered as a prefixed string."""
 
     NUM_BITS = None  # Must be defined in subclasses.
 
+    # None of our parameters affect the database column, so changing them (or
+    # swapping an integer field for a spicy one) should not alter it.
+    non_db_attrs = models.Field.non_db_attrs + (
+        "prefix",
+        "sep",
+        "encoding",
+        "pad",
+        "randomize",
+        "shard_bits",
+        "shard",
+        "precompute",
+        "obfuscate",
+    )
+
     def __init__(
         self,
         prefix,
@@ -58,6 +83,10 @@ class BaseSpicyAutoField(models.Field):
         encoding=ENCODING_BASE_62,
         randomize=False,
         pad=False,
+        shard_bits=0,
+        shard=0,
+        precompute=False,
+        obfuscate=False,
         *args,
         **kwargs,
     ):
@@ -79,11 +108,34 @@ class BaseSpicyAutoField(models.Field):
             )
         if randomize and kwargs.get("default"):
             raise ImproperlyConfigured("cannot provide both `randomize` and `default`")
+        if randomize and obfuscate:
+            raise ImproperlyConfigured("cannot provide both `randomize` and `obfuscate`")
+        if obfuscate:
+            # Fail at startup (when models are imported), not on first use.
+            get_obfuscation_key()
+        if not isinstance(shard_bits, int) or not 0 <= shard_bits <= self.NUM_BITS - 3:
+            raise ImproperlyConfigured(
+                f"shard_bits must be an integer between 0 and {self.NUM_BITS - 3}"
+            )
+        if not callable(shard) and (not isinstance(shard, int) or not 0 <= shard < 2**shard_bits):
+            raise ImproperlyConfigured(
+                f"shard must be a callable or an integer between 0 and {2**shard_bits - 1}"
+            )
+        if not randomize and (callable(shard) or shard):
+            # Sequential ids come from the database, which knows nothing of `shard`.
+            raise ImproperlyConfigured(
+                "`shard` requires `randomize`; for sequential ids, start each shard's "
+                "sequence at `get_shard_offset()` instead"
+            )
 
         self.prefix = prefix
         self.sep = sep
         self.randomize = randomize
         self.pad = pad
+        self.shard_bits = shard_bits
+        self.shard = shard
+        self.precompute = precompute
+        self.obfuscate = obfuscate
 
         if randomize:
             # Inject our default value generator when `randomize` is enabled.
@@ -94,7 +146,14 @@ class BaseSpicyAutoField(models.Field):
         self.encoding = encoding
         self.codec = CODECS_BY_ENCODING[self.encoding]
         self.max_value = 2 ** (self.NUM_BITS - 1) - 1
+        self.shard_shift = self.NUM_BITS - 1 - self.shard_bits
+        self.max_shard = 2**self.shard_bits - 1
         self.max_characters = math.ceil(math.log(self.max_value, len(self.codec.digits)))
+        self.table_encoder = None
+        if self.precompute:
+            self.table_encoder = baseconv.get_table_encoder(
+                self.codec, self.max_value, self.max_characters if self.pad else None
+            )
         self.re = get_regex(f"{self.prefix}{self.sep}", self.codec, self.pad, self.max_characters)
 
         # Expose the re pattern without word boundaries, for use in places where they
@@ -107,7 +166,42 @@ class BaseSpicyAutoField(models.Field):
 
         super().__init__(*args, **kwargs)
 
+    @functools.cached_property
+    def permutation(self):
+        """The `FeistelPermutation` used when `obfuscate` is set.
+
+        Keyed from the `SPICY_ID_OBFUSCATION_KEY` setting, and the field's
+        prefix and size, so that each field type gets its own permutation.
+        """
+        key = f"{get_obfuscation_key()}:{self.prefix}:{self.NUM_BITS}".encode()
+        # Zero is excluded, as it is never a valid id.
+        return feistel.FeistelPermutation(key, self.NUM_BITS - 1, min_value=1)
+
+    def _decode(self, encoded):
+        """Decodes the encoded portion of a valid spicy id to its database value.
+
+        Raises `MalformedSpicyIdError` when `obfuscate` is set and the decoded
+        value is not a possible output of the permutation.
+        """
+        value = self.codec.decode(encoded)
+        if self.obfuscate:
+            if not 1 <= value <= self.max_value:
+                raise MalformedSpicyIdError(
+                    f"value is out of range [1, {self.max_value}] for an obfuscated id"
+                )
+            return self.permutation.decrypt(value)
+        return value
+
     def _to_string(self, intvalue):
+        if self.obfuscate:
+            # Encoding an unpermuted value would leak it, and could not be decoded.
+            if not 1 <= intvalue <= self.max_value:
+                raise SpicyIdError(
+                    f"value {intvalue} is out of range [1, {self.max_value}] for an obfuscated id"
+                )
+            intvalue = self.permutation.encrypt(intvalue)
+        if self.table_encoder is not None and 0 <= intvalue <= self.max_value:
+            return f"{self.prefix}{self.sep}{self.table_encoder.encode(intvalue)}"
         encoded = self.codec.encode(intvalue)
         unpadded_len = len(encoded)
         if self.pad and unpadded_len < self.max_characters:
@@ -120,8 +214,44 @@ class BaseSpicyAutoField(models.Field):
         return self._to_string(self._generate_random_default_value())
 
     def _generate_random_default_value(self):
-        """Generates a random value on the range [1, self.max_value)."""
-        return 1 + secrets.randbelow(self.max_value - 1)
+        """Generates a random value on the range [1, self.max_value).
+
+        When `shard_bits` is set, the random portion only covers the low bits,
+        and the current shard number is placed in the high bits.
+        """
+        if not self.shard_bits:
+            return 1 + secrets.randbelow(self.max_value - 1)
+        low_bits_max = 2**self.shard_shift - 1
+        return self.get_shard_offset(self._current_shard()) | (
+            1 + secrets.randbelow(low_bits_max - 1)
+        )
+
+    def _current_shard(self):
+        shard = self.shard() if callable(self.shard) else self.shard
+        if not isinstance(shard, int) or not 0 <= shard <= self.max_shard:
+            raise SpicyIdError(f"shard {repr(shard)} is out of range [0, {self.max_shard}]")
+        return shard
+
+    def get_shard(self, value):
+        """Returns the shard number embedded in `value`.
+
+        `value` may be a spicy id string or its underlying integer. Raises
+        `MalformedSpicyIdError` if a string value is not valid for this field.
+        Always returns `0` when `shard_bits` is not set.
+        """
+        if isinstance(value, str):
+            value = self._decode(self._validate_string_internal(value))
+        return value >> self.shard_shift
+
+    def get_shard_offset(self, shard):
+        """Returns the lowest integer value belonging to `shard`.
+
+        Useful for starting the database sequence of each shard at the right
+        place, so that sequential ids also carry the shard number.
+        """
+        if not 0 <= shard <= self.max_shard:
+            raise SpicyIdError(f"shard {repr(shard)} is out of range [0, {self.max_shard}]")
+        return shard << self.shard_shift
 
     def _validate_string_internal(self, s):
         if not isinstance(s, str):
@@ -146,6 +276,41 @@ class BaseSpicyAutoField(models.Field):
         # want public clients to depend on it).
         self._validate_string_internal(strval)
 
+    def _decode_strings_internal(self, strvals):
+        """Validates and decodes many strings in a single pass.
+
+        Returns a tuple of `(values, invalid)`: the decoded integers of all valid
+        strings, and the list of strings which were not valid.
+        """
+        match = self.re.match
+        decode = self._decode
+        values = []
+        invalid = []
+        for s in strvals:
+            m = match(s) if isinstance(s, str) else None
+            if m is None:
+                invalid.append(s)
+                continue
+            try:
+                values.append(decode(m.group(2)))
+            except MalformedSpicyIdError:
+                invalid.append(s)
+        return values, invalid
+
+    def decode_strings(self, strvals):
+        """Validates and decodes many spicy id strings at once.
+
+        Returns the list of underlying integer values, in order. Raises
+        `MalformedSpicyIdError` describing every invalid value, if any.
+        """
+        values, invalid = self._decode_strings_internal(strvals)
+        if invalid:
+            raise MalformedSpicyIdError(
+                f"{len(invalid)} value(s) are not valid ids for this field: "
+                f"{', '.join(repr(s) for s in invalid)}"
+            )
+        return values
+
     def from_db_value(self, value, expression, connection):
         if value is None:
             return None
@@ -158,7 +323,7 @@ class BaseSpicyAutoField(models.Field):
             return super().get_prep_value(value)
         try:
             encoded = self._validate_string_internal(value)
-            return self.codec.decode(encoded)
+            return self._decode(encoded)
         except MalformedSpicyIdError as e:
             raise ProgrammingError(f"the value {repr(value)} is not valid: {e}")
 
@@ -178,6 +343,18 @@ class BaseSpicyAutoField(models.Field):
         kwargs["encoding"] = self.encoding
         kwargs["pad"] = self.pad
         kwargs["randomize"] = self.randomize
+        # Newer parameters are only emitted when set, so existing migrations are
+        # not disturbed.
+        if self.shard_bits:
+            kwargs["shard_bits"] = self.shard_bits
+            # A callable `shard` only matters at runtime, and may not be
+            # serializable (e.g. a lambda), so keep it out of migrations.
+            if not callable(self.shard):
+                kwargs["shard"] = self.shard
+        if self.precompute:
+            kwargs["precompute"] = True
+        if self.obfuscate:
+            kwargs["obfuscate"] = True
         if kwargs["randomize"] and "default" in kwargs:
             # Keep our built-in `default` function hidden from migrations, etc., when
             # the higher-level feature `randomize` is enabled.
@@ -232,3 +409,35 @@ class SpicySmallAutoField(BaseSpicyAutoField, models.SmallAutoField):
     """A Spicy ID field that is backed by a standard 16-bit Django SmallAutoField."""
 
     NUM_BITS = 16
+
+
+class SpicyIdList(Sequence):
+    """A read-only list of spicy ids, held as their underlying integers.
+
+    Items are encoded to spicy id strings with the field's codec only when
+    accessed, so a large list can be passed around (for example, to a JSON
+    encoder) without building intermediate strings or model instances.
+    """
+
+    def __init__(self, field, values):
+        self.field = field
+        self.values = list(values)
+
+    def __repr__(self):
+        return "<%s: %s ids for %s>" % (self.__class__.__name__, len(self.values), self.field)
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return SpicyIdList(self.field, self.values[index])
+        return self.field._to_string(self.values[index])
+
+    def __iter__(self):
+        return map(self.field._to_string, self.values)
+
+    def __eq__(self, other):
+        if isinstance(other, (SpicyIdList, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
@@ -0,0 +1,76 @@
+import re
+
+from django import forms
+from django.core.exceptions import ValidationError
+
+from .fields import SpicyIdList
+
+# Separates ids in pasted lists: any run of whitespace and/or commas.
+ID_SEPARATOR_RE = re.compile(r"[\s,]+")
+
+
+def split_ids(value):
+    """Splits a pasted string of ids into a list, dropping empty entries."""
+    return [s for s in ID_SEPARATOR_RE.split(value) if s]
+
+
+class SpicyIdMultipleField(forms.Field):
+    """A form field which accepts a list of spicy ids for a single model field.
+
+    Input may be a list of strings, or a single string of ids separated by
+    whitespace and/or commas (as pasted by a human). All values are validated
+    and decoded in one pass, and every invalid value is reported in a single
+    error. The cleaned value is a `SpicyIdList` of the ids, with duplicates
+    removed: it compares and iterates as a list of spicy id strings, and its
+    `.values` are the decoded integers.
+    """
+
+    widget = forms.Textarea
+    default_error_messages = {
+        "invalid": "Enter valid ids. %(count)d value(s) are invalid: %(values)s",
+        "invalid_list": "Enter a list of ids.",
+        "max_ids": "Enter at most %(max_ids)d ids (got %(count)d).",
+    }
+
+    # The maximum number of invalid values listed in the error message.
+    max_reported_errors = 20
+
+    def __init__(self, model_field, *, max_ids=None, **kwargs):
+        self.model_field = model_field
+        self.max_ids = max_ids
+        super().__init__(**kwargs)
+
+    def to_python(self, value):
+        if value in self.empty_values:
+            return []
+        if isinstance(value, str):
+            value = split_ids(value)
+        elif not isinstance(value, (list, tuple)):
+            raise ValidationError(self.error_messages["invalid_list"], code="invalid")
+        return list(dict.fromkeys(value))
+
+    def validate(self, value):
+        super().validate(value)
+        if self.max_ids is not None and len(value) > self.max_ids:
+            raise ValidationError(
+                self.error_messages["max_ids"],
+                code="max_ids",
+                params={"max_ids": self.max_ids, "count": len(value)},
+            )
+
+    def clean(self, value):
+        value = super().clean(value)
+        decoded, invalid = self.model_field._decode_strings_internal(value)
+        if invalid:
+            reported = ", ".join(repr(s) for s in invalid[: self.max_reported_errors])
+            if len(invalid) > self.max_reported_errors:
+                reported += ", ..."
+            raise ValidationError(
+                self.error_messages["invalid"],
+                code="invalid",
+                params={"count": len(invalid), "values": reported},
+            )
+        return SpicyIdList(self.model_field, decoded)
+
+    def has_changed(self, initial, data):
+        return self.to_python(initial) != self.to_python(data)
@@ -0,0 +1,142 @@
+import time
+
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections, models, transaction
+
+
+class Command(BaseCommand):
+    help = (
+        "Backfills an integer column with new, sequential ids, for migrating a "
+        "table off a non-integer (e.g. UUID) primary key onto a spicy field. "
+        "Rows are processed in primary key order, in small chunks, each in its "
+        "own transaction. Rows which already have a value are skipped, so the "
+        "command can be stopped and resumed at any time. Rows inserted behind "
+        "the current position are picked up by re-scanning the table; the "
+        "command fails if any remain without a value."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("model", help="The model to backfill, as `app_label.ModelName`.")
+        parser.add_argument(
+            "field_name", help="The nullable integer field to store the new ids in."
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Number of rows to update per transaction. Defaults to 1000.",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0.0,
+            help="Seconds to pause between chunks, to throttle load. Defaults to 0.",
+        )
+        parser.add_argument(
+            "--start",
+            type=int,
+            default=1,
+            help=(
+                "The lowest id to assign. Defaults to 1. Ids always continue after "
+                "the highest value already present in the column."
+            ),
+        )
+        parser.add_argument(
+            "--max-passes",
+            type=int,
+            default=3,
+            help=(
+                "Number of times to scan the table, to pick up rows inserted during "
+                "the backfill. Defaults to 3."
+            ),
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            choices=tuple(connections),
+            help='Nominates the database to backfill. Defaults to the "default" database.',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            model = apps.get_model(options["model"])
+        except (LookupError, ValueError) as e:
+            raise CommandError(str(e))
+        try:
+            field = model._meta.get_field(options["field_name"])
+        except models.FieldDoesNotExist as e:
+            raise CommandError(str(e))
+        if not isinstance(field, models.IntegerField) or isinstance(field, models.AutoField):
+            raise CommandError(f"{field} must be a (non-auto) integer field")
+        if not field.null:
+            raise CommandError(f"{field} must be nullable")
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be at least 1")
+        if options["max_passes"] < 1:
+            raise CommandError("--max-passes must be at least 1")
+
+        database = options["database"]
+        queryset = model._base_manager.using(database)
+        pending = queryset.filter(**{f"{field.name}__isnull": True}).order_by("pk")
+        pk_attname = model._meta.pk.attname
+
+        total = pending.count()
+        highest = queryset.aggregate(highest=models.Max(field.name))["highest"]
+        next_value = max(options["start"], (highest or 0) + 1)
+        if not total:
+            self.stdout.write(f"{model._meta.label}.{field.name}: nothing to backfill.")
+            return
+
+        done = 0
+        started_at = time.monotonic()
+        for _ in range(options["max_passes"]):
+            last_pk = None
+            while True:
+                # Each chunk continues from the last primary key seen, so the database
+                # never has to skip over rows which were already backfilled.
+                chunk = pending if last_pk is None else pending.filter(pk__gt=last_pk)
+                with transaction.atomic(using=database):
+                    pks = list(chunk.values_list("pk", flat=True)[: options["chunk_size"]])
+                    if not pks:
+                        break
+                    last_pk = pks[-1]
+                    objs = []
+                    for pk in pks:
+                        obj = model(**{pk_attname: pk})
+                        setattr(obj, field.attname, next_value)
+                        next_value += 1
+                        objs.append(obj)
+                    queryset.bulk_update(objs, [field.name])
+                done += len(pks)
+
+                elapsed = time.monotonic() - started_at
+                self.stdout.write(
+                    f"{done}/{total} rows ({100 * done / total:.1f}%), "
+                    f"{done / elapsed if elapsed else 0:.0f} rows/s, last id {next_value - 1}"
+                )
+                if options["sleep"]:
+                    time.sleep(options["sleep"])
+
+            # Rows inserted during the pass may have landed behind the cursor (e.g.
+            # with random UUID keys), so start over until none are left.
+            remaining = pending.count()
+            if not remaining:
+                break
+            total = done + remaining
+            self.stdout.write(f"{remaining} rows were inserted during the pass, re-scanning.")
+        else:
+            raise CommandError(
+                f"Backfilled {done} rows of {model._meta.label}.{field.name}, but {remaining} "
+                f"rows inserted during the backfill still have no value after "
+                f"{options['max_passes']} passes. Re-run the command, and make sure new "
+                "rows get a value before making the column the primary key."
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Backfilled {done} rows of {model._meta.label}.{field.name}. Before "
+                "inserting new rows, make sure the column's sequence starts after "
+                f"{next_value - 1}."
+            )
+        )
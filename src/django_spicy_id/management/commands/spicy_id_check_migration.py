@@ -0,0 +1,38 @@
+from django.core.management.base import CommandError
+from django.core.management.commands.sqlmigrate import Command as SqlMigrateCommand
+
+# Written by Django in place of operations (like `RunPython`) which have no SQL
+# form; such operations may still touch every row of a table.
+CANNOT_BE_WRITTEN_AS_SQL = "-- THIS OPERATION CANNOT BE WRITTEN AS SQL"
+
+
+class Command(SqlMigrateCommand):
+    help = (
+        "Checks whether the named migration is metadata-only, i.e. runs no SQL. "
+        "Use this to confirm that swapping an integer primary key for a spicy "
+        "field will not rewrite or lock the table. Exits with an error, printing "
+        "the SQL, if any would run, or if the migration has operations (like "
+        "RunPython) which cannot be written as SQL."
+    )
+
+    output_transaction = False
+
+    def handle(self, *args, **options):
+        output = super().handle(*args, **options)
+        lines = [line.strip() for line in output.splitlines()]
+        statements = [line for line in lines if line and not line.startswith("--")]
+        migration = f"{options['app_label']}.{options['migration_name']}"
+        if CANNOT_BE_WRITTEN_AS_SQL in lines:
+            self.stdout.write(output)
+            raise CommandError(
+                f"{migration} is not metadata-only: it has operations (like RunPython) "
+                "which cannot be written as SQL, and may rewrite or lock tables."
+            )
+        if not statements:
+            self.stdout.write(self.style.SUCCESS(f"{migration} is metadata-only: it runs no SQL."))
+            return
+        self.stdout.write(output)
+        raise CommandError(
+            f"{migration} is not metadata-only: it runs SQL on the "
+            f"{options['database']!r} database, which may rewrite or lock tables."
+        )
@@ -0,0 +1,72 @@
+from django.conf import settings
+
+from django_spicy_id.errors import SpicyIdError
+
+from . import fields
+
+
+class SpicyShardRouter:
+    """A Django database router which routes sharded spicy ids to their database.
+
+    The shard number is decoded directly from the id (see the `shard_bits`
+    field parameter), so no lookup is needed. Shard numbers are mapped to
+    database aliases by the `SPICY_ID_SHARD_DATABASES` setting, for example
+    `{0: "shard0", 1: "shard1"}`.
+
+    Models whose primary key is not a sharded spicy field are left to the
+    next router in `DATABASE_ROUTERS`.
+
+    Reference: https://docs.djangoproject.com/en/4.2/topics/db/multi-db/#automatic-database-routing
+    """
+
+    def __init__(self, databases=None):
+        if databases is None:
+            databases = getattr(settings, "SPICY_ID_SHARD_DATABASES", {})
+        self.databases = dict(databases)
+
+    def get_sharded_field(self, model):
+        """Returns the sharded spicy primary key field of `model`, or `None`."""
+        field = model._meta.pk
+        if isinstance(field, fields.BaseSpicyAutoField) and field.shard_bits:
+            return field
+        return None
+
+    def db_for_id(self, model, value):
+        """Returns the database alias holding the row of `model` with primary key `value`.
+
+        Raises `SpicyIdError` if the model is not sharded or the shard has no
+        configured database, and `MalformedSpicyIdError` if `value` is invalid.
+        """
+        field = self.get_sharded_field(model)
+        if field is None:
+            raise SpicyIdError(f"{model._meta.label} does not have a sharded spicy primary key")
+        shard = field.get_shard(value)
+        try:
+            return self.databases[shard]
+        except KeyError:
+            raise SpicyIdError(f"no database configured for shard {shard}")
+
+    def split_ids_by_db(self, model, values):
+        """Groups primary key `values` (e.g. for a `pk__in` query) by database alias.
+
+        Returns a dict of `{alias: [value, ...]}`, preserving the order of `values`.
+        """
+        by_db = {}
+        for value in values:
+            by_db.setdefault(self.db_for_id(model, value), []).append(value)
+        return by_db
+
+    def _db_for_instance(self, model, **hints):
+        instance = hints.get("instance")
+        if instance is None or instance.pk is None:
+            return None
+        field = self.get_sharded_field(type(instance))
+        if field is None:
+            return None
+        return self.databases.get(field.get_shard(instance.pk))
+
+    def db_for_read(self, model, **hints):
+        return self._db_for_instance(model, **hints)
+
+    def db_for_write(self, model, **hints):
+        return self._db_for_instance(model, **hints)
@@ -0,0 +1,37 @@
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+
+from django_spicy_id.errors import SpicyIdError
+
+from . import fields
+from .fields import SpicyIdList
+
+
+def get_id_list(queryset, field_name="pk"):
+    """Returns the values of spicy field `field_name` in `queryset`, as a `SpicyIdList`.
+
+    Equivalent to `queryset.values_list(field_name, flat=True)`, but the database
+    integers are fetched without converting them to strings.
+    """
+    opts = queryset.model._meta
+    field = opts.pk if field_name == "pk" else opts.get_field(field_name)
+    if not isinstance(field, fields.BaseSpicyAutoField):
+        raise SpicyIdError(f"{field} is not a spicy field")
+    raw = models.ExpressionWrapper(models.F(field.name), output_field=models.BigIntegerField())
+    return SpicyIdList(field, queryset.values_list(raw, flat=True))
+
+
+class SpicyJSONEncoder(DjangoJSONEncoder):
+    """A `DjangoJSONEncoder` which also knows how to encode a `SpicyIdList`."""
+
+    def default(self, o):
+        if isinstance(o, SpicyIdList):
+            return list(o)
+        return super().default(o)
+
+
+def orjson_default(o):
+    """A `default=` hook for `orjson.dumps()` which encodes a `SpicyIdList`."""
+    if isinstance(o, SpicyIdList):
+        return list(o)
+    raise TypeError(f"Type is not JSON serializable: {type(o).__name__}")
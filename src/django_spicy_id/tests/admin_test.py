@@ -0,0 +1,54 @@
+from django.contrib import admin
+from django.contrib.contenttypes.models import ContentType
+from django.test import RequestFactory, TestCase
+
+from django_spicy_id.admin import SpicyIdSearchMixin
+from django_spicy_id.tests import models
+
+
+class ExampleAdmin(SpicyIdSearchMixin, admin.ModelAdmin):
+    search_fields = ("=id",)
+
+
+class TestSpicyIdSearchMixin(TestCase):
+    def setUp(self):
+        self.model = models.HexModel_WithDefaults
+        self.model_admin = ExampleAdmin(self.model, admin.AdminSite())
+        self.request = RequestFactory().get("/")
+        self.objs = [self.model.objects.create() for _ in range(3)]
+
+    def search(self, search_term):
+        return self.model_admin.get_search_results(
+            self.request, self.model.objects.all(), search_term
+        )
+
+    def test_search_by_ids(self):
+        queryset, may_have_duplicates = self.search(f"{self.objs[0].id}, {self.objs[2].id}")
+        self.assertEqual([self.objs[0], self.objs[2]], list(queryset.order_by("id")))
+        self.assertFalse(may_have_duplicates)
+        self.assertIn("IN (1, 3)", str(queryset.query))
+
+    def test_search_by_undecodable_ids(self):
+        model = models.Base62Model_WithObfuscate
+        obj = model.objects.create()
+        model_admin = ExampleAdmin(model, admin.AdminSite())
+
+        # Matches the field's regex, but decodes to a value out of range.
+        queryset, _ = model_admin.get_search_results(
+            self.request, model.objects.all(), f"ex_zzzzzzzzzzz {obj.id}"
+        )
+        self.assertEqual([obj], list(queryset))
+
+    def test_search_falls_through(self):
+        queryset, _ = self.search("")
+        self.assertEqual(3, queryset.count())
+
+    def test_search_ignores_other_models(self):
+        class OtherAdmin(SpicyIdSearchMixin, admin.ModelAdmin):
+            search_fields = ("model",)
+
+        model_admin = OtherAdmin(ContentType, admin.AdminSite())
+        queryset, _ = model_admin.get_search_results(
+            self.request, ContentType.objects.all(), "ex_1"
+        )
+        self.assertIn("LIKE", str(queryset.query))
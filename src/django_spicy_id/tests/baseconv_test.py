@@ -21,7 +21,15 @@ Adapted from `django.utils.baseconv` which bears the following license:
 
 from unittest import TestCase
 
-from django_spicy_id.baseconv import BaseConverter, base16, base58, base62
+from django_spicy_id.baseconv import (
+    MAX_TABLE_ENTRIES,
+    BaseConverter,
+    TableEncoder,
+    base16,
+    base58,
+    base62,
+    get_table_encoder,
+)
 
 
 class TestBaseConv(TestCase):
@@ -72,3 +80,49 @@ class TestBaseConv(TestCase):
     def test_repr(self):
         base7 = BaseConverter("cjdhel3", sign="g")
         self.assertEqual(repr(base7), "<BaseConverter: base7 (cjdhel3)>")
+
+
+class TestTableEncoder(TestCase):
+    def assertEncodesLikeConverter(self, encoder, values):
+        for i in values:
+            expected = encoder.converter.encode(i)
+            if encoder.pad_to:
+                expected = expected.rjust(encoder.pad_to, encoder.converter.digits[0])
+            self.assertEqual(expected, encoder.encode(i), f"for {i}")
+
+    def test_full_table(self):
+        for converter in [base16, base58, base62]:
+            for pad_to in [None, 3]:
+                encoder = TableEncoder(converter, 2**15 - 1, pad_to)
+                self.assertTrue(encoder.is_full_table)
+                self.assertEqual(0, encoder.memory_usage())
+                self.assertEncodesLikeConverter(encoder, range(2**15))
+                self.assertEqual(2**15, len(encoder.table))
+                self.assertGreater(encoder.memory_usage(), 0)
+
+    def test_chunked_table(self):
+        values = [0, 1, 57, 58, 61, 62, 2**16 - 1, 2**16, 123456789, 2**31 - 1, 2**63 - 1]
+        values += [58**k + d for k in range(1, 11) for d in (-1, 0, 1)]
+        values += [62**k + d for k in range(1, 11) for d in (-1, 0, 1)]
+        for converter in [base16, base58, base62]:
+            for pad_to in [None, 16]:
+                encoder = TableEncoder(converter, 2**63 - 1, pad_to)
+                self.assertFalse(encoder.is_full_table)
+                self.assertEncodesLikeConverter(encoder, values)
+                self.assertLessEqual(len(encoder.table), MAX_TABLE_ENTRIES)
+
+    def test_chunk_digits(self):
+        self.assertEqual(4, TableEncoder(base16, 2**63 - 1).chunk_digits)
+        self.assertEqual(2, TableEncoder(base58, 2**63 - 1).chunk_digits)
+        self.assertEqual(2, TableEncoder(base62, 2**63 - 1).chunk_digits)
+
+    def test_get_table_encoder(self):
+        encoder = get_table_encoder(base62, 2**31 - 1, 6)
+        self.assertIs(encoder, get_table_encoder(base62, 2**31 - 1, 6))
+        self.assertIsNot(encoder, get_table_encoder(base62, 2**31 - 1))
+
+    def test_repr(self):
+        self.assertEqual(
+            "<TableEncoder: base16, max_value=32767, pad_to=4>",
+            repr(TableEncoder(base16, 2**15 - 1, 4)),
+        )
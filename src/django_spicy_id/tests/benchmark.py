@@ -0,0 +1,45 @@
+"""Micro-benchmarks for encoding and decoding spicy ids.
+
+Run with `make bench`, or:
+
+    DJANGO_SETTINGS_MODULE=django_spicy_id.tests.settings python -m django_spicy_id.tests.benchmark
+"""
+
+import random
+import timeit
+
+import django
+
+
+def time_per_call(func, values):
+    """Returns the mean time of `func(value)` over `values`, in microseconds."""
+    seconds = timeit.timeit(lambda: [func(v) for v in values], number=1)
+    return 1e6 * seconds / len(values)
+
+
+def main(num_values=20000):
+    django.setup()
+
+    from django_spicy_id import SpicyAutoField, SpicyBigAutoField, SpicySmallAutoField
+
+    rng = random.Random(0)
+    print(f"{'field':<22}{'config':<22}{'encode (us)':>14}{'decode (us)':>14}")
+    for field_class in (SpicySmallAutoField, SpicyAutoField, SpicyBigAutoField):
+        configs = {
+            "default": {},
+            "precompute": {"precompute": True},
+            "obfuscate": {"obfuscate": True},
+            "obfuscate+precompute": {"obfuscate": True, "precompute": True},
+        }
+        for name, kwargs in configs.items():
+            field = field_class(prefix="ex", **kwargs)
+            values = [rng.randint(1, field.max_value) for _ in range(num_values)]
+            field._to_string(1)  # Build any lazy tables up front.
+            strings = [field._to_string(v) for v in values]
+            encode = time_per_call(field._to_string, values)
+            decode = time_per_call(field.get_prep_value, strings)
+            print(f"{field_class.__name__:<22}{name:<22}{encode:>14.2f}{decode:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+from django.db import migrations
+
+
+def capitalize_names(apps, schema_editor):
+    Widget = apps.get_model("django_spicy_id_tests", "Widget")
+    for widget in Widget.objects.all():
+        widget.name = widget.name.capitalize()
+        widget.save(update_fields=["name"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [("django_spicy_id_tests", "0001_initial")]
+
+    operations = [
+        migrations.RunPython(capitalize_names, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,15 @@
+from django.db import migrations
+
+import django_spicy_id.fields
+
+
+class Migration(migrations.Migration):
+    dependencies = [("django_spicy_id_tests", "0002_widget_names")]
+
+    operations = [
+        migrations.AlterField(
+            model_name="widget",
+            name="id",
+            field=django_spicy_id.fields.SpicyBigAutoField("wd", primary_key=True, serialize=False),
+        ),
+    ]
@@ -0,0 +1,225 @@
+import uuid
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.db.models import BigAutoField
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from django_spicy_id import SpicyBigAutoField
+from django_spicy_id.tests import models
+
+
+class TestCheckMigrationCommand(TransactionTestCase):
+    # SQLite cannot collect schema SQL inside a transaction.
+    def test_metadata_only_migration(self):
+        # Only changes field validators, so runs no SQL.
+        out = StringIO()
+        call_command(
+            "spicy_id_check_migration",
+            "auth",
+            "0007_alter_validators_add_error_messages",
+            stdout=out,
+            stderr=StringIO(),
+        )
+        self.assertIn("is metadata-only", out.getvalue())
+
+    def test_migration_with_sql(self):
+        out = StringIO()
+        with self.assertRaisesMessage(CommandError, "is not metadata-only"):
+            call_command(
+                "spicy_id_check_migration",
+                "contenttypes",
+                "0002_remove_content_type_name",
+                stdout=out,
+            )
+        self.assertIn("django_content_type", out.getvalue())
+
+    @override_settings(
+        MIGRATION_MODULES={"django_spicy_id_tests": "django_spicy_id.tests.check_migrations"}
+    )
+    def test_migration_with_run_python(self):
+        # Runs no SQL of its own, but may rewrite every row.
+        out = StringIO()
+        with self.assertRaisesMessage(CommandError, "cannot be written as SQL"):
+            call_command(
+                "spicy_id_check_migration",
+                "django_spicy_id_tests",
+                "0002_widget_names",
+                stdout=out,
+            )
+        self.assertIn("THIS OPERATION CANNOT BE WRITTEN AS SQL", out.getvalue())
+
+    @override_settings(
+        MIGRATION_MODULES={"django_spicy_id_tests": "django_spicy_id.tests.check_migrations"}
+    )
+    def test_swap_big_auto_field_for_spicy(self):
+        # Changing the field's class is an alteration as far as Django is
+        # concerned. Whether it runs any SQL is up to the backend: SQLite
+        # rebuilds the table.
+        old = BigAutoField(primary_key=True)
+        new = SpicyBigAutoField("wd", primary_key=True)
+        for field in (old, new):
+            field.set_attributes_from_name("id")
+        self.assertTrue(connection.schema_editor()._field_should_be_altered(old, new))
+
+        if connection.vendor != "sqlite":
+            self.skipTest("only SQLite is known to rebuild the table")
+        out = StringIO()
+        with self.assertRaisesMessage(CommandError, "is not metadata-only"):
+            call_command(
+                "spicy_id_check_migration",
+                "django_spicy_id_tests",
+                "0003_widget_spicy_id",
+                stdout=out,
+            )
+        self.assertIn('CREATE TABLE "new__django_spicy_id_tests_widget"', out.getvalue())
+
+    def test_field_params_are_not_db_attrs(self):
+        old = models.Model_WithDefaults._meta.pk
+        _, _, _, old_kwargs = old.deconstruct()
+        for kwargs in (
+            {"prefix": "other"},
+            {"sep": "-", "pad": True, "encoding": "hex"},
+            {"randomize": True, "shard_bits": 4, "shard": 1},
+        ):
+            new = SpicyBigAutoField(**{**old_kwargs, **kwargs})
+            new.set_attributes_from_name("id")
+            self.assertFalse(connection.schema_editor()._field_should_be_altered(old, new))
+
+
+class TestBackfillCommand(TestCase):
+    def test_backfill(self):
+        model = models.UuidModel_ForBackfill
+        model.objects.create(new_id=10)
+        objs = [model.objects.create() for _ in range(5)]
+
+        out = StringIO()
+        call_command(
+            "spicy_id_backfill",
+            "django_spicy_id_tests.UuidModel_ForBackfill",
+            "new_id",
+            chunk_size=2,
+            stdout=out,
+        )
+        self.assertIn("2/5 rows (40.0%)", out.getvalue())
+        self.assertIn("5/5 rows (100.0%)", out.getvalue())
+        self.assertIn("Backfilled 5 rows", out.getvalue())
+
+        objs.sort(key=lambda o: o.pk)
+        new_ids = [model.objects.get(pk=o.pk).new_id for o in objs]
+        self.assertEqual(list(range(11, 16)), new_ids)
+
+        # Running again is a no-op.
+        out = StringIO()
+        call_command(
+            "spicy_id_backfill", "django_spicy_id_tests.UuidModel_ForBackfill", "new_id", stdout=out
+        )
+        self.assertIn("nothing to backfill", out.getvalue())
+
+    def test_backfill_uses_keyset_pagination(self):
+        model = models.UuidModel_ForBackfill
+        objs = sorted((model.objects.create() for _ in range(5)), key=lambda o: o.pk)
+
+        with CaptureQueriesContext(connection) as queries:
+            call_command(
+                "spicy_id_backfill",
+                "django_spicy_id_tests.UuidModel_ForBackfill",
+                "new_id",
+                chunk_size=2,
+                stdout=StringIO(),
+            )
+        selects = [
+            q["sql"] for q in queries if q["sql"].startswith("SELECT") and "LIMIT 2" in q["sql"]
+        ]
+        self.assertEqual(4, len(selects))
+        self.assertNotIn(" > ", selects[0])
+        for select in selects[1:]:
+            self.assertIn(" > ", select)
+        self.assertEqual(list(range(1, 6)), [model.objects.get(pk=o.pk).new_id for o in objs])
+
+    def test_backfill_rescans_for_rows_inserted_behind_cursor(self):
+        model = models.UuidModel_ForBackfill
+        for _ in range(3):
+            model.objects.create()
+
+        # The lowest possible key always lands behind the cursor.
+        def insert_behind_cursor(seconds):
+            if not model.objects.filter(id=uuid.UUID(int=0)).exists():
+                model.objects.create(id=uuid.UUID(int=0))
+
+        out = StringIO()
+        with mock.patch("time.sleep", side_effect=insert_behind_cursor):
+            call_command(
+                "spicy_id_backfill",
+                "django_spicy_id_tests.UuidModel_ForBackfill",
+                "new_id",
+                chunk_size=2,
+                sleep=1,
+                stdout=out,
+            )
+        self.assertIn("1 rows were inserted during the pass, re-scanning.", out.getvalue())
+        self.assertIn("Backfilled 4 rows", out.getvalue())
+        self.assertEqual(4, model.objects.get(id=uuid.UUID(int=0)).new_id)
+        self.assertFalse(model.objects.filter(new_id__isnull=True).exists())
+
+    def test_backfill_fails_when_rows_remain(self):
+        model = models.UuidModel_ForBackfill
+        model.objects.create()
+
+        def insert_row(seconds):
+            model.objects.create()
+
+        with mock.patch("time.sleep", side_effect=insert_row):
+            with self.assertRaisesMessage(
+                CommandError, "but 1 rows inserted during the backfill still have no value"
+            ):
+                call_command(
+                    "spicy_id_backfill",
+                    "django_spicy_id_tests.UuidModel_ForBackfill",
+                    "new_id",
+                    sleep=1,
+                    max_passes=1,
+                    stdout=StringIO(),
+                )
+
+    def test_backfill_resumes(self):
+        model = models.UuidModel_ForBackfill
+        for _ in range(3):
+            model.objects.create()
+        call_command(
+            "spicy_id_backfill",
+            "django_spicy_id_tests.UuidModel_ForBackfill",
+            "new_id",
+            start=100,
+            stdout=StringIO(),
+        )
+        model.objects.create()
+        call_command(
+            "spicy_id_backfill",
+            "django_spicy_id_tests.UuidModel_ForBackfill",
+            "new_id",
+            stdout=StringIO(),
+        )
+        self.assertEqual(
+            [100, 101, 102, 103],
+            sorted(model.objects.values_list("new_id", flat=True)),
+        )
+
+    def test_backfill_errors(self):
+        with self.assertRaises(CommandError):
+            call_command("spicy_id_backfill", "django_spicy_id_tests.Nope", "new_id")
+        with self.assertRaisesMessage(CommandError, "must be a (non-auto) integer field"):
+            call_command("spicy_id_backfill", "django_spicy_id_tests.UuidModel_ForBackfill", "id")
+        with self.assertRaisesMessage(CommandError, "must be a (non-auto) integer field"):
+            call_command("spicy_id_backfill", "django_spicy_id_tests.Model_WithDefaults", "id")
+        with self.assertRaisesMessage(CommandError, "--max-passes must be at least 1"):
+            call_command(
+                "spicy_id_backfill",
+                "django_spicy_id_tests.UuidModel_ForBackfill",
+                "new_id",
+                max_passes=0,
+            )
@@ -0,0 +1,57 @@
+from unittest import TestCase
+
+from django_spicy_id.feistel import FeistelPermutation
+
+
+class TestFeistelPermutation(TestCase):
+    def test_is_permutation(self):
+        for num_bits in (2, 3, 8, 15):
+            p = FeistelPermutation(b"key", num_bits)
+            encrypted = [p.encrypt(i) for i in range(2**num_bits)]
+            self.assertEqual(list(range(2**num_bits)), sorted(encrypted))
+            self.assertEqual(list(range(2**num_bits)), [p.decrypt(i) for i in encrypted])
+
+    def test_min_value(self):
+        for min_value in (1, 5):
+            p = FeistelPermutation(b"key", 8, min_value=min_value)
+            encrypted = [p.encrypt(i) for i in range(min_value, 2**8)]
+            self.assertEqual(list(range(min_value, 2**8)), sorted(encrypted))
+            self.assertEqual(list(range(min_value, 2**8)), [p.decrypt(i) for i in encrypted])
+        with self.assertRaisesRegex(ValueError, "out of range"):
+            FeistelPermutation(b"key", 8, min_value=1).encrypt(0)
+        with self.assertRaisesRegex(ValueError, "min_value must be on the range"):
+            FeistelPermutation(b"key", 8, min_value=2**8)
+
+    def test_round_trip(self):
+        for num_bits in (31, 63):
+            p = FeistelPermutation(b"key", num_bits)
+            for i in (0, 1, 2, 123456789, 2**num_bits - 2, 2**num_bits - 1):
+                encrypted = p.encrypt(i)
+                self.assertLessEqual(encrypted, p.max_value)
+                self.assertEqual(i, p.decrypt(encrypted))
+
+    def test_keyed(self):
+        a = FeistelPermutation(b"key", 63)
+        b = FeistelPermutation(b"other key", 63)
+        self.assertEqual(a.encrypt(1), FeistelPermutation(b"key", 63).encrypt(1))
+        self.assertNotEqual(a.encrypt(1), b.encrypt(1))
+        self.assertNotEqual([1, 2, 3], [a.encrypt(i) for i in (1, 2, 3)])
+
+    def test_errors(self):
+        p = FeistelPermutation(b"key", 15)
+        with self.assertRaisesRegex(ValueError, "out of range"):
+            p.encrypt(2**15)
+        with self.assertRaisesRegex(ValueError, "out of range"):
+            p.decrypt(-1)
+        with self.assertRaisesRegex(ValueError, "key must be non-empty bytes"):
+            FeistelPermutation("key", 15)
+        with self.assertRaisesRegex(ValueError, "rounds must be an even number"):
+            FeistelPermutation(b"key", 15, rounds=3)
+        with self.assertRaisesRegex(ValueError, "num_bits must be between"):
+            FeistelPermutation(b"key", 1)
+
+    def test_repr(self):
+        self.assertEqual(
+            "<FeistelPermutation: num_bits=15, rounds=8, min_value=0>",
+            repr(FeistelPermutation(b"k", 15)),
+        )
@@ -1,11 +1,18 @@
 from unittest import mock
 
 from django.core.exceptions import ImproperlyConfigured
+from django.db.migrations.writer import MigrationWriter
 from django.db.utils import ProgrammingError
-from django.test import TestCase
-
-from django_spicy_id import SpicyAutoField
+from django.test import TestCase, override_settings
+
+from django_spicy_id import (
+    MalformedSpicyIdError,
+    SpicyAutoField,
+    SpicyBigAutoField,
+    SpicyIdError,
+)
 from django_spicy_id.fields import LEGAL_PREFIX_RE
+from django_spicy_id.serialization import get_id_list
 from django_spicy_id.tests import models
 
 
@@ -58,6 +65,23 @@ class TestFields(TestCase):
         ):
             SpicyAutoField(prefix="ex", default=123, randomize=True)
 
+        with self.assertRaisesMessage(
+            ImproperlyConfigured, "cannot provide both `randomize` and `obfuscate`"
+        ):
+            SpicyAutoField(prefix="ex", randomize=True, obfuscate=True)
+
+        with self.assertRaisesMessage(ImproperlyConfigured, "shard_bits must be an integer"):
+            SpicyAutoField(prefix="ex", shard_bits=30)
+
+        with self.assertRaisesMessage(ImproperlyConfigured, "shard must be a callable"):
+            SpicyAutoField(prefix="ex", shard_bits=2, shard=4)
+
+        with self.assertRaisesMessage(ImproperlyConfigured, "`shard` requires `randomize`"):
+            SpicyAutoField(prefix="ex", shard_bits=2, shard=1)
+
+        with self.assertRaisesMessage(ImproperlyConfigured, "`shard` requires `randomize`"):
+            SpicyAutoField(prefix="ex", shard_bits=2, shard=lambda: 0)
+
     def test_model_with_defaults(self):
         model = models.Model_WithDefaults
 
@@ -218,3 +242,148 @@ class TestFields(TestCase):
         o.save()
         self.assertEqual("ex_2", o.id)
         self.assertFalse(o._state.adding)
+
+    def test_model_with_shards(self):
+        model = models.Base62Model_WithShards
+        field = model._meta.pk
+
+        self.assertEqual(2**59, field.get_shard_offset(1))
+        self.assertEqual(3 * 2**59, field.get_shard_offset(3))
+        with self.assertRaises(SpicyIdError):
+            field.get_shard_offset(16)
+
+        o = model.objects.create(id=field.get_shard_offset(3) + 1)
+        self.assertEqual("ex_23kaWRE8iGn", o.id)
+        self.assertEqual(3, field.get_shard(o.id))
+        self.assertEqual(3, field.get_shard(field.get_shard_offset(3) + 1))
+        self.assertEqual(0, field.get_shard("ex_1"))
+        self.assertEqual(15, field.get_shard(2**63 - 1))
+        with self.assertRaises(MalformedSpicyIdError):
+            field.get_shard("ex_0001")
+
+        name, path, args, kwargs = field.deconstruct()
+        self.assertEqual(4, kwargs["shard_bits"])
+        self.assertEqual(0, kwargs["shard"])
+        _, _, _, kwargs = models.HexModel_WithShardsAndRandomize._meta.pk.deconstruct()
+        self.assertEqual(5, kwargs["shard"])
+        _, _, _, kwargs = models.Model_WithDefaults._meta.pk.deconstruct()
+        self.assertNotIn("shard_bits", kwargs)
+
+    @mock.patch("secrets.randbelow")
+    def test_hex_model_with_shards_and_randomize(self, mock_secrets_randbelow):
+        model = models.HexModel_WithShardsAndRandomize
+
+        mock_secrets_randbelow.return_value = 0x122
+        o = model.objects.create()
+        self.assertEqual("ex_2800000000000123", o.id)
+        mock_secrets_randbelow.assert_called_with(2**59 - 2)
+        self.assertEqual(5, model._meta.pk.get_shard(o.id))
+
+    @mock.patch("secrets.randbelow")
+    def test_randomize_with_callable_shard(self, mock_secrets_randbelow):
+        mock_secrets_randbelow.return_value = 0
+        field = SpicyAutoField(
+            prefix="ex", encoding="hex", randomize=True, shard_bits=2, shard=lambda: 2
+        )
+        self.assertEqual("ex_40000001", field._new_random_id())
+
+        # The callable is left out of migrations.
+        name, path, args, kwargs = field.deconstruct()
+        self.assertEqual(2, kwargs["shard_bits"])
+        self.assertNotIn("shard", kwargs)
+        MigrationWriter.serialize(field)
+
+        field = SpicyAutoField(prefix="ex", randomize=True, shard_bits=2, shard=lambda: 4)
+        with self.assertRaisesMessage(SpicyIdError, "shard 4 is out of range [0, 3]"):
+            field._new_random_id()
+
+    def test_model_with_precompute(self):
+        model = models.Base62Model_WithPrecompute
+        self.assertFalse(model._meta.pk.table_encoder.is_full_table)
+
+        obj1 = model.objects.create()
+        self.assertEqual("ex_1", obj1.id)
+        custom = model.objects.create(id=123456789)
+        self.assertEqual("ex_8M0kX", custom.id)
+        self.assertEqual(custom, model.objects.filter(id="ex_8M0kX").first())
+        boundary = model.objects.create(id=2**63 - 1)
+        self.assertEqual("ex_AzL8n0Y58m7", boundary.id)
+
+        _, _, _, kwargs = model._meta.pk.deconstruct()
+        self.assertTrue(kwargs["precompute"])
+
+    def test_small_model_with_precompute_and_padding(self):
+        model = models.HexSmallModel_WithPrecomputeAndPadding
+        self.assertTrue(model._meta.pk.table_encoder.is_full_table)
+
+        obj1 = model.objects.create()
+        self.assertEqual("ex_0001", obj1.id)
+        boundary = model.objects.create(id=2**15 - 1)
+        self.assertEqual("ex_7fff", boundary.id)
+        self.assertEqual(boundary, model.objects.filter(id="ex_7fff").first())
+
+    def test_model_with_obfuscate(self):
+        model = models.Base62Model_WithObfuscate
+        field = model._meta.pk
+
+        obj1 = model.objects.create()
+        self.assertEqual("ex_fpqkjAaQ3R", obj1.id)
+        obj2 = model.objects.create()
+        self.assertEqual("ex_3gmbBC2yEQU", obj2.id)
+        custom = model.objects.create(id=123456789)
+        self.assertEqual("ex_9AePQVknFnQ", custom.id)
+
+        # The database still holds the sequential values.
+        self.assertEqual(
+            [1, 2, 123456789],
+            sorted(get_id_list(model.objects.all()).values),
+        )
+        self.assertEqual(custom, model.objects.filter(id="ex_9AePQVknFnQ").first())
+        self.assertEqual([1, 2], field.decode_strings(["ex_fpqkjAaQ3R", "ex_3gmbBC2yEQU"]))
+
+        _, _, _, kwargs = field.deconstruct()
+        self.assertTrue(kwargs["obfuscate"])
+
+    def test_obfuscate_is_keyed(self):
+        with override_settings(SPICY_ID_OBFUSCATION_KEY="other"):
+            field = SpicyBigAutoField(prefix="ex", obfuscate=True)
+            self.assertNotEqual("ex_fpqkjAaQ3R", field._to_string(1))
+            self.assertEqual(1, field.get_prep_value(field._to_string(1)))
+
+        field = SpicyBigAutoField(prefix="other", obfuscate=True)
+        self.assertNotEqual("other_fpqkjAaQ3R", field._to_string(1))
+
+        # A missing key is reported when the field is constructed.
+        with override_settings(SPICY_ID_OBFUSCATION_KEY=None):
+            with self.assertRaisesMessage(ImproperlyConfigured, "SPICY_ID_OBFUSCATION_KEY"):
+                SpicyBigAutoField(prefix="ex", obfuscate=True)
+
+    def test_obfuscate_rejects_out_of_range_ids(self):
+        # These match the field's regex, but decode outside [1, max_value].
+        fields_and_ids = (
+            (models.Base62Model_WithObfuscate._meta.pk, "ex_zzzzzzzzzzz"),
+            (SpicyBigAutoField(prefix="ex", pad=True, obfuscate=True), "ex_00000000000"),
+        )
+        for field, bad_id in fields_and_ids:
+            with self.subTest(bad_id):
+                self.assertIsNotNone(field.re.match(bad_id))
+                with self.assertRaises(ProgrammingError):
+                    field.get_prep_value(bad_id)
+                with self.assertRaisesMessage(
+                    MalformedSpicyIdError,
+                    f"1 value(s) are not valid ids for this field: {bad_id!r}",
+                ):
+                    field.decode_strings([bad_id])
+                with self.assertRaises(MalformedSpicyIdError):
+                    field.get_shard(bad_id)
+                good_id = field._to_string(7)
+                self.assertEqual(([7], [bad_id]), field._decode_strings_internal([good_id, bad_id]))
+
+    def test_obfuscate_rejects_out_of_range_values(self):
+        field = models.Base62Model_WithObfuscate._meta.pk
+        for value in (0, -1, 2**63):
+            with self.subTest(value):
+                with self.assertRaisesMessage(
+                    SpicyIdError, "out of range [1, 9223372036854775807]"
+                ):
+                    field._to_string(value)
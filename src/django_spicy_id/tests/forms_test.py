@@ -0,0 +1,86 @@
+from django import forms
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+
+from django_spicy_id import MalformedSpicyIdError, SpicyIdMultipleField
+from django_spicy_id.forms import split_ids
+from django_spicy_id.fields import SpicyIdList
+from django_spicy_id.tests import models
+
+
+class TestSpicyIdMultipleField(TestCase):
+    def setUp(self):
+        self.model_field = models.HexModel_WithDefaults._meta.pk
+
+    def test_split_ids(self):
+        self.assertEqual(["ex_1", "ex_2", "ex_3"], split_ids(" ex_1,ex_2\n\tex_3, "))
+        self.assertEqual([], split_ids(" ,\n"))
+
+    def test_clean(self):
+        field = SpicyIdMultipleField(self.model_field)
+        cleaned = field.clean("ex_1\nex_ff, ex_1")
+        self.assertIsInstance(cleaned, SpicyIdList)
+        self.assertEqual(["ex_1", "ex_ff"], cleaned)
+        self.assertEqual([1, 255], cleaned.values)
+        self.assertEqual(["ex_a"], field.clean(["ex_a"]))
+
+        with self.assertRaisesMessage(ValidationError, "This field is required."):
+            field.clean("  ")
+        self.assertEqual([], SpicyIdMultipleField(self.model_field, required=False).clean(""))
+
+    def test_clean_reports_all_errors(self):
+        field = SpicyIdMultipleField(self.model_field)
+        with self.assertRaisesMessage(
+            ValidationError, "2 value(s) are invalid: 'ex_0001', 'bloop'"
+        ):
+            field.clean("ex_1 ex_0001 ex_2 bloop")
+
+        field.max_reported_errors = 2
+        with self.assertRaisesMessage(ValidationError, "'ex_g', 'ex_h', ..."):
+            field.clean("ex_g ex_h ex_i")
+
+    def test_clean_rejects_non_lists(self):
+        field = SpicyIdMultipleField(self.model_field)
+        for value in (5, object(), {"ex_1": 1}):
+            with self.subTest(value=value):
+                with self.assertRaisesMessage(ValidationError, "Enter a list of ids.") as cm:
+                    field.clean(value)
+                self.assertEqual("invalid", cm.exception.code)
+        self.assertEqual(["ex_1", "ex_2"], field.clean(("ex_1", "ex_2")))
+
+    def test_clean_keeps_no_state_on_field(self):
+        field = SpicyIdMultipleField(self.model_field)
+        first = field.clean("ex_1 ex_2")
+        with self.assertRaises(ValidationError):
+            field.clean("ex_1 bloop")
+        self.assertEqual([3], field.clean("ex_3").values)
+        self.assertEqual([1, 2], first.values)
+
+    def test_clean_reports_undecodable_ids(self):
+        field = SpicyIdMultipleField(models.Base62Model_WithObfuscate._meta.pk)
+        with self.assertRaisesMessage(ValidationError, "1 value(s) are invalid: 'ex_zzzzzzzzzzz'"):
+            field.clean("ex_zzzzzzzzzzz")
+
+    def test_max_ids(self):
+        field = SpicyIdMultipleField(self.model_field, max_ids=2)
+        with self.assertRaisesMessage(ValidationError, "Enter at most 2 ids (got 3)."):
+            field.clean("ex_1 ex_2 ex_3")
+
+    def test_in_form(self):
+        class ExampleForm(forms.Form):
+            ids = SpicyIdMultipleField(self.model_field)
+
+        form = ExampleForm({"ids": "ex_1 ex_2"})
+        self.assertTrue(form.is_valid())
+        self.assertEqual(["ex_1", "ex_2"], form.cleaned_data["ids"])
+        self.assertEqual([1, 2], form.cleaned_data["ids"].values)
+
+        form = ExampleForm({"ids": "ex_1 ex_X"})
+        self.assertFalse(form.is_valid())
+
+    def test_decode_strings(self):
+        self.assertEqual([1, 255], self.model_field.decode_strings(["ex_1", "ex_ff"]))
+        with self.assertRaisesMessage(
+            MalformedSpicyIdError, "2 value(s) are not valid ids for this field: 'ex_0', None"
+        ):
+            self.model_field.decode_strings(["ex_1", "ex_0", None])
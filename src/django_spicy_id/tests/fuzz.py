@@ -0,0 +1,301 @@
+"""Differential fuzzing harness for spicy id codecs and validators.
+
+Compares candidate implementations (the library's codecs, validators and
+fields) against simple reference implementations of today's behavior, on
+random and boundary inputs, and reports the throughput of each side. Used by
+`fuzz_test.py`; can also be run at scale with `make fuzz`, or:
+
+    DJANGO_SETTINGS_MODULE=django_spicy_id.tests.settings \
+        python -m django_spicy_id.tests.fuzz [iterations]
+"""
+
+import itertools
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+
+import django
+from django.db.utils import ProgrammingError
+
+from django_spicy_id import SpicyAutoField, SpicyBigAutoField, SpicySmallAutoField
+from django_spicy_id.fields import CODECS_BY_ENCODING
+
+# Stands in for any exception raised by an implementation, so that references
+# and candidates may raise different exception types for the same bad input.
+ERROR = "<error>"
+
+# Characters to splice into otherwise-valid ids: look-alikes missing from some
+# alphabets, case flips, separators, whitespace and non-ascii.
+FOREIGN_CHARS = "0OIlGgZz-_ .\n\té🆒"
+
+
+def reference_encode(value, digits, pad_to=None):
+    """Encodes a non-negative integer, left-padding to `pad_to` characters if given."""
+    base = len(digits)
+    encoded = ""
+    while True:
+        value, rem = divmod(value, base)
+        encoded = digits[rem] + encoded
+        if not value:
+            break
+    if pad_to:
+        encoded = encoded.rjust(pad_to, digits[0])
+    return encoded
+
+
+def reference_parse(s, preamble, digits, pad, char_len):
+    """Returns the integer value of spicy id `s`, or raises `ValueError`.
+
+    Mirrors the rules of `fields.get_regex()`: with `pad`, the encoded part must
+    be exactly `char_len` digits. Without it, it must be 1 to `char_len` digits
+    and must not start with the pad character. As with a regex ending in `$`,
+    a single trailing newline is tolerated.
+    """
+    if not isinstance(s, str) or not s.startswith(preamble):
+        raise ValueError("bad preamble")
+    encoded = s[len(preamble) :]
+    if encoded.endswith("\n"):
+        encoded = encoded[:-1]
+    if not encoded or any(c not in digits for c in encoded):
+        raise ValueError("bad digits")
+    if pad and len(encoded) != char_len:
+        raise ValueError("bad padded length")
+    if not pad and (len(encoded) > char_len or encoded[0] == digits[0]):
+        raise ValueError("bad unpadded length or leading pad character")
+    value = 0
+    for c in encoded:
+        value = value * len(digits) + digits.index(c)
+    return value
+
+
+def int_inputs(rng, max_value, base, count):
+    """Returns boundary values on [0, max_value], followed by `count` random ones.
+
+    Random values are spread evenly across bit lengths, so short encodings are
+    exercised as often as long ones.
+    """
+    values = {0, 1, 2, max_value - 1, max_value}
+    power = base
+    while power <= max_value:
+        values.update((power - 1, power, power + 1))
+        power *= base
+    values = sorted(v for v in values if 0 <= v <= max_value)
+    for _ in range(count):
+        bits = rng.randint(1, max_value.bit_length())
+        values.append(rng.randint(2 ** (bits - 1), min(2**bits - 1, max_value)))
+    return values
+
+
+def string_inputs(rng, valid_ids, preamble, digits, char_len):
+    """Returns `valid_ids` plus a handful of mutations of each, and some extremes.
+
+    The extremes are the longest allowed encodings made of only the smallest
+    and only the largest digit, which may decode outside of the field's range.
+    """
+    strings = []
+    for s in valid_ids:
+        encoded = s[len(preamble) :]
+        i = rng.randrange(len(encoded))
+        strings += [
+            s,
+            s + "\n",
+            preamble + digits[0] + encoded,
+            preamble + encoded[1:],
+            s + rng.choice(digits),
+            preamble + encoded[:i] + rng.choice(FOREIGN_CHARS) + encoded[i + 1 :],
+            preamble + encoded.swapcase(),
+            preamble[:-1] + encoded,
+            "x" + s,
+        ]
+    strings += ["", preamble, preamble + "\n", preamble[:-1]]
+    strings += [preamble + digits[0] * char_len, preamble + digits[-1] * char_len]
+    return strings
+
+
+def accepts(func, rejected_exception):
+    """Wraps `func` to return whether it accepted its input.
+
+    Only `rejected_exception` counts as a rejection; any other exception
+    propagates, and so shows up as a mismatch against a reference which
+    returns `True` or `False`.
+    """
+
+    def wrapper(x):
+        try:
+            func(x)
+        except rejected_exception:
+            return False
+        return True
+
+    return wrapper
+
+
+def _run(func, inputs):
+    outputs = []
+    append = outputs.append
+    start = time.perf_counter()
+    for x in inputs:
+        try:
+            append(func(x))
+        except Exception:
+            append(ERROR)
+    return outputs, time.perf_counter() - start
+
+
+@dataclass
+class Comparison:
+    name: str
+    count: int
+    reference_seconds: float
+    candidate_seconds: float
+    # Up to `max_reported_mismatches` tuples of (input, reference output, candidate output).
+    mismatches: list = field(default_factory=list)
+    num_mismatches: int = 0
+
+    def throughput(self, seconds):
+        return self.count / seconds if seconds else float("inf")
+
+
+class DifferentialHarness:
+    """Runs reference and candidate implementations side by side.
+
+    Each comparison records every input whose outputs differ (treating any
+    raised exception as the same `ERROR` outcome), and the time taken by each
+    implementation.
+    """
+
+    max_reported_mismatches = 10
+
+    def __init__(self):
+        self.comparisons = []
+
+    def compare(self, name, reference, candidate, inputs):
+        inputs = list(inputs)
+        reference_outputs, reference_seconds = _run(reference, inputs)
+        candidate_outputs, candidate_seconds = _run(candidate, inputs)
+        comparison = Comparison(name, len(inputs), reference_seconds, candidate_seconds)
+        for x, expected, actual in zip(inputs, reference_outputs, candidate_outputs):
+            if expected != actual:
+                comparison.num_mismatches += 1
+                if len(comparison.mismatches) < self.max_reported_mismatches:
+                    comparison.mismatches.append((x, expected, actual))
+        self.comparisons.append(comparison)
+        return comparison
+
+    def report(self):
+        """Returns a table of throughput (in operations per second) and mismatch counts."""
+        width = max([len(c.name) for c in self.comparisons] + [10])
+        lines = [
+            f"{'comparison':<{width}}{'inputs':>10}{'ref ops/s':>14}{'cand ops/s':>14}{'bad':>6}"
+        ]
+        for c in self.comparisons:
+            lines.append(
+                f"{c.name:<{width}}{c.count:>10}"
+                f"{c.throughput(c.reference_seconds):>14.0f}"
+                f"{c.throughput(c.candidate_seconds):>14.0f}"
+                f"{c.num_mismatches:>6}"
+            )
+        return "\n".join(lines)
+
+
+def field_configs():
+    """Yields `(name, field)` for every field width, encoding, `pad` and `precompute`."""
+    for field_class, encoding, pad, precompute in itertools.product(
+        (SpicySmallAutoField, SpicyAutoField, SpicyBigAutoField),
+        CODECS_BY_ENCODING,
+        (False, True),
+        (False, True),
+    ):
+        name = f"{field_class.__name__}/{encoding}/pad={pad}/precompute={precompute}"
+        yield name, field_class("ex", encoding=encoding, pad=pad, precompute=precompute)
+
+
+def run_all(harness, iterations, seed=0):
+    """Compares every field configuration's codec, validator and field methods."""
+    rng = random.Random(seed)
+    for name, f in field_configs():
+        digits = f.codec.digits
+        preamble = f"{f.prefix}{f.sep}"
+        pad_to = f.max_characters if f.pad else None
+        ints = int_inputs(rng, f.max_value, len(digits), iterations)
+        f._to_string(1)  # Build any lazy tables outside of the timings.
+
+        harness.compare(
+            f"{name} encode",
+            lambda i: preamble + reference_encode(i, digits, pad_to),
+            f._to_string,
+            ints,
+        )
+        if f.table_encoder is not None:
+            harness.compare(
+                f"{name} table",
+                lambda i: reference_encode(i, digits, pad_to),
+                f.table_encoder.encode,
+                ints,
+            )
+
+        valid_ids = [f._to_string(i) for i in ints[:iterations]]
+        strings = string_inputs(rng, valid_ids, preamble, digits, f.max_characters)
+
+        def parse(s):
+            return reference_parse(s, preamble, digits, f.pad, f.max_characters)
+
+        harness.compare(
+            f"{name} regex",
+            lambda s: parse(s) is not None,
+            lambda s: f.re.match(s) is not None or ERROR,
+            strings,
+        )
+        harness.compare(f"{name} decode", parse, f.get_prep_value, strings)
+
+    # Obfuscated ids have no independent reference for their values. Check that
+    # they round-trip, and that exactly the well-formed strings which decode to
+    # [1, max_value] are accepted, with anything else rejected as malformed.
+    for field_class, pad in itertools.product(
+        (SpicySmallAutoField, SpicyAutoField, SpicyBigAutoField), (False, True)
+    ):
+        f = field_class("ex", pad=pad, obfuscate=True)
+        name = f"{field_class.__name__}/obfuscate/pad={pad}"
+        digits = f.codec.digits
+        preamble = f"{f.prefix}{f.sep}"
+        ints = int_inputs(rng, f.max_value, len(digits), iterations)[1:]
+        f._to_string(1)
+
+        harness.compare(
+            f"{name} round trip",
+            lambda i: i,
+            lambda i: f.get_prep_value(f._to_string(i)),
+            ints,
+        )
+
+        def reference_accepts(s):
+            try:
+                value = reference_parse(s, preamble, digits, f.pad, f.max_characters)
+            except ValueError:
+                return False
+            return 1 <= value <= f.max_value
+
+        valid_ids = [f._to_string(i) for i in ints[:iterations]]
+        harness.compare(
+            f"{name} decode",
+            reference_accepts,
+            accepts(f.get_prep_value, ProgrammingError),
+            # Empty values are handed to Django's integer field handling instead.
+            [s for s in string_inputs(rng, valid_ids, preamble, digits, f.max_characters) if s],
+        )
+    return harness
+
+
+def main(iterations=100000):
+    django.setup()
+    harness = run_all(DifferentialHarness(), iterations)
+    print(harness.report())
+    failed = [c for c in harness.comparisons if c.num_mismatches]
+    for c in failed:
+        print(f"\n{c.name}: {c.num_mismatches} mismatches, e.g. {c.mismatches}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(*(int(arg) for arg in sys.argv[1:])))
@@ -0,0 +1,60 @@
+import os
+import random
+from unittest import TestCase
+
+from django_spicy_id.baseconv import base58
+from django_spicy_id.tests import fuzz
+
+# Random inputs per field configuration. Raise this (e.g. to 1000000) for a
+# thorough run; `make fuzz` runs the same comparisons with a throughput report.
+ITERATIONS = int(os.environ.get("SPICY_ID_FUZZ_ITERATIONS", 200))
+
+
+class TestDifferentialFuzz(TestCase):
+    def test_all_configurations_match_reference(self):
+        harness = fuzz.run_all(fuzz.DifferentialHarness(), ITERATIONS)
+        for c in harness.comparisons:
+            with self.subTest(c.name):
+                self.assertEqual(
+                    0, c.num_mismatches, f"examples: {c.mismatches}\n{harness.report()}"
+                )
+
+    def test_harness_reports_mismatches(self):
+        harness = fuzz.DifferentialHarness()
+        harness.max_reported_mismatches = 2
+        c = harness.compare("broken", lambda i: i, lambda i: i if i < 5 else -i, range(10))
+        self.assertEqual(5, c.num_mismatches)
+        self.assertEqual([(5, 5, -5), (6, 6, -6)], c.mismatches)
+
+        # Exceptions of different types count as the same outcome.
+        c = harness.compare("errors", int, lambda s: int(s, 10) + 0, ["1", "x", None])
+        self.assertEqual(0, c.num_mismatches)
+        self.assertIn("broken", harness.report())
+
+    def test_accepts(self):
+        accepts_int = fuzz.accepts(int, ValueError)
+        self.assertTrue(accepts_int("1"))
+        self.assertFalse(accepts_int("x"))
+        with self.assertRaises(TypeError):
+            accepts_int(None)
+
+    def test_reference_parse(self):
+        digits = base58.digits
+
+        def parse(s, pad=False):
+            return fuzz.reference_parse(s, "ex_", digits, pad, 4)
+
+        self.assertEqual(57, parse("ex_z"))
+        self.assertEqual(57, parse("ex_z\n"))
+        self.assertEqual(57, parse("ex_111z", pad=True))
+        for bad in ("ex_", "ex_1z", "ex_0", "ex_zzzzz", "ex_z\n\n", "ex-z", "ex_z ", None):
+            with self.assertRaises(ValueError, msg=repr(bad)):
+                parse(bad)
+        with self.assertRaises(ValueError):
+            parse("ex_z", pad=True)
+
+    def test_int_inputs(self):
+        values = fuzz.int_inputs(random.Random(0), 2**15 - 1, 58, 100)
+        self.assertEqual([0, 1, 2, 57, 58, 59], values[:6])
+        self.assertIn(2**15 - 1, values)
+        self.assertTrue(all(0 <= v < 2**15 for v in values))
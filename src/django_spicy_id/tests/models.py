@@ -1,6 +1,8 @@
+import uuid
+
 from django.db import models
 
-from django_spicy_id import SpicyAutoField, SpicyBigAutoField
+from django_spicy_id import SpicyAutoField, SpicyBigAutoField, SpicySmallAutoField
 
 
 class Model_WithDefaults(models.Model):
@@ -35,3 +37,30 @@ class HexModel_WithRandomize(models.Model):
 
 class SpicyAutoFieldModel_WithRandomize(models.Model):
     id = SpicyAutoField("ex", primary_key=True, encoding="hex", randomize=True)
+
+
+class Base62Model_WithShards(models.Model):
+    id = SpicyBigAutoField("ex", primary_key=True, shard_bits=4)
+
+
+class HexModel_WithShardsAndRandomize(models.Model):
+    id = SpicyBigAutoField(
+        "ex", primary_key=True, encoding="hex", randomize=True, shard_bits=4, shard=5
+    )
+
+
+class Base62Model_WithPrecompute(models.Model):
+    id = SpicyBigAutoField("ex", primary_key=True, precompute=True)
+
+
+class HexSmallModel_WithPrecomputeAndPadding(models.Model):
+    id = SpicySmallAutoField("ex", primary_key=True, encoding="hex", pad=True, precompute=True)
+
+
+class Base62Model_WithObfuscate(models.Model):
+    id = SpicyBigAutoField("ex", primary_key=True, obfuscate=True)
+
+
+class UuidModel_ForBackfill(models.Model):
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4)
+    new_id = models.BigIntegerField(null=True, unique=True)
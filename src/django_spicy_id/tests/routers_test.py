@@ -0,0 +1,52 @@
+from django.test import TestCase, override_settings
+
+from django_spicy_id import MalformedSpicyIdError, SpicyIdError, SpicyShardRouter
+from django_spicy_id.tests import models
+
+
+class TestSpicyShardRouter(TestCase):
+    def setUp(self):
+        self.router = SpicyShardRouter({0: "default", 3: "shard3"})
+        self.model = models.Base62Model_WithShards
+        self.field = self.model._meta.pk
+
+    def test_databases_from_settings(self):
+        with override_settings(SPICY_ID_SHARD_DATABASES={1: "shard1"}):
+            self.assertEqual({1: "shard1"}, SpicyShardRouter().databases)
+        self.assertEqual({}, SpicyShardRouter().databases)
+
+    def test_db_for_id(self):
+        self.assertEqual("default", self.router.db_for_id(self.model, "ex_1"))
+        shard3_id = self.field._to_string(self.field.get_shard_offset(3) + 1)
+        self.assertEqual("shard3", self.router.db_for_id(self.model, shard3_id))
+        self.assertEqual(
+            "shard3", self.router.db_for_id(self.model, self.field.get_shard_offset(3) + 1)
+        )
+
+        with self.assertRaisesMessage(SpicyIdError, "no database configured for shard 1"):
+            self.router.db_for_id(self.model, self.field.get_shard_offset(1) + 1)
+        with self.assertRaises(MalformedSpicyIdError):
+            self.router.db_for_id(self.model, "bloop_1")
+        with self.assertRaisesMessage(SpicyIdError, "does not have a sharded spicy primary key"):
+            self.router.db_for_id(models.Model_WithDefaults, "ex_1")
+
+    def test_split_ids_by_db(self):
+        shard3_ids = [
+            self.field._to_string(self.field.get_shard_offset(3) + i) for i in range(1, 3)
+        ]
+        values = ["ex_1", shard3_ids[0], "ex_2", shard3_ids[1]]
+        self.assertEqual(
+            {"default": ["ex_1", "ex_2"], "shard3": shard3_ids},
+            self.router.split_ids_by_db(self.model, values),
+        )
+
+    def test_db_for_instance(self):
+        shard3_id = self.field.get_shard_offset(3) + 1
+        instance = self.model(id=shard3_id)
+        self.assertEqual("shard3", self.router.db_for_read(self.model, instance=instance))
+        self.assertEqual("shard3", self.router.db_for_write(self.model, instance=instance))
+
+        self.assertIsNone(self.router.db_for_read(self.model))
+        self.assertIsNone(self.router.db_for_read(self.model, instance=self.model()))
+        unsharded = models.Model_WithDefaults(id=1)
+        self.assertIsNone(self.router.db_for_write(self.model, instance=unsharded))
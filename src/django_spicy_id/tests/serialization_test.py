@@ -0,0 +1,65 @@
+import json
+from unittest import mock, skipUnless
+
+from django.test import TestCase
+
+from django_spicy_id import SpicyIdError
+from django_spicy_id.serialization import (
+    SpicyIdList,
+    SpicyJSONEncoder,
+    get_id_list,
+    orjson_default,
+)
+from django_spicy_id.tests import models
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class TestSerialization(TestCase):
+    def setUp(self):
+        self.model = models.HexModel_WithPadding
+        self.field = self.model._meta.pk
+        for i in (1, 255, 4096):
+            self.model.objects.create(id=i)
+
+    def test_id_list(self):
+        ids = SpicyIdList(self.field, [1, 255])
+        self.assertEqual(2, len(ids))
+        self.assertEqual("ex_00000000000000ff", ids[1])
+        self.assertEqual(["ex_0000000000000001", "ex_00000000000000ff"], list(ids))
+        self.assertEqual(["ex_00000000000000ff"], ids[1:])
+        self.assertIsInstance(ids[1:], SpicyIdList)
+
+    def test_get_id_list(self):
+        qs = self.model.objects.order_by("id")
+        with mock.patch.object(self.field, "from_db_value") as mock_from_db_value:
+            ids = get_id_list(qs)
+            mock_from_db_value.assert_not_called()
+        self.assertEqual([1, 255, 4096], ids.values)
+        self.assertEqual(list(qs.values_list("id", flat=True)), list(ids))
+        self.assertEqual(ids, get_id_list(qs, "id"))
+
+        with self.assertRaisesMessage(SpicyIdError, "is not a spicy field"):
+            get_id_list(models.UuidModel_ForBackfill.objects.all())
+
+    def test_json_encoder(self):
+        ids = get_id_list(self.model.objects.order_by("id"))
+        self.assertEqual(
+            '{"ids": ["ex_0000000000000001", "ex_00000000000000ff", "ex_0000000000001000"]}',
+            json.dumps({"ids": ids}, cls=SpicyJSONEncoder),
+        )
+        with self.assertRaises(TypeError):
+            json.dumps(object(), cls=SpicyJSONEncoder)
+
+    @skipUnless(orjson, "orjson is not installed")
+    def test_orjson_default(self):
+        ids = get_id_list(self.model.objects.order_by("id")[:2])
+        self.assertEqual(
+            b'{"ids":["ex_0000000000000001","ex_00000000000000ff"]}',
+            orjson.dumps({"ids": ids}, default=orjson_default),
+        )
+        with self.assertRaises(TypeError):
+            orjson.dumps(object(), default=orjson_default)